@@ -23,9 +23,11 @@ https://docs.snowflake.com/user-guide/snowpipe-streaming/snowpipe-streaming-high
 
 import json
 import logging
+import threading
 import time
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Dict, Optional, List
 import requests
@@ -37,6 +39,36 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 # Import JWT authentication module
 from snowflake_jwt_auth import SnowflakeJWTAuth
 
+# Optional: httpx gives HTTP/2 multiplexing plus connection pooling; without
+# it a requests.Session still reuses keep-alive connections
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    httpx = None
+    HTTPX_AVAILABLE = False
+
+# Error types that can surface from either HTTP backend
+if HTTPX_AVAILABLE:
+    _HTTP_ERRORS = (requests.exceptions.RequestException, httpx.HTTPError)
+else:
+    _HTTP_ERRORS = (requests.exceptions.RequestException,)
+
+# Optional: orjson is several times faster than stdlib json on ARM and emits
+# bytes directly, which is exactly what the HTTPS payload needs
+try:
+    import orjson
+
+    def dumps_bytes(obj) -> bytes:
+        """Serialize obj to UTF-8 JSON bytes (orjson fast path)."""
+        return orjson.dumps(obj)
+except ImportError:
+    orjson = None
+
+    def dumps_bytes(obj) -> bytes:
+        """Serialize obj to UTF-8 JSON bytes (stdlib fallback)."""
+        return json.dumps(obj).encode('utf-8')
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -49,6 +81,35 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+class PartialInsertError(Exception):
+    """
+    Raised by insert_rows when one or more channel partitions failed at the
+    transport/server level while others may have succeeded.
+
+    Carries enough state for the caller's transient-failure path: 'inserted'
+    is the number of rows confirmed appended on healthy channels, and
+    'retry_rows' holds the rows whose outcome is unknown (failed partitions)
+    plus any row-level rejections, so only those are resubmitted.
+    """
+
+    def __init__(self, message: str, inserted: int = 0, retry_rows=None):
+        super().__init__(message)
+        self.inserted = inserted
+        self.retry_rows = retry_rows if retry_rows is not None else []
+
+
+class StreamingChannel:
+    """Per-channel streaming state (name, continuation and offset tokens)."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.continuation_token = None
+        self.offset_token = 0
+        # Appends to one channel must serialize - each request's continuation
+        # token comes from the previous response
+        self.lock = threading.Lock()
+
+
 class SnowpipeStreamingClient:
     """
     Client for Snowpipe Streaming v2 REST API - PRODUCTION MODE
@@ -62,11 +123,17 @@ class SnowpipeStreamingClient:
     - High-performance data streaming via NDJSON over HTTP
     """
     
-    def __init__(self, config_file: str = 'snowflake_config.json'):
+    def __init__(self, config_file: str = 'snowflake_config.json', num_channels: int = 1):
         """
         Initialize the streaming client.
-        
+
         This client ONLY uses Snowpipe Streaming REST API - no direct database connections.
+
+        Args:
+            config_file: Path to Snowflake configuration file
+            num_channels: Number of channels to fan rows out across. Snowflake
+                          recommends multiple channels per client for
+                          throughput - a single channel serializes server-side
         """
         logger.info("=" * 70)
         logger.info("SNOWPIPE STREAMING CLIENT - PRODUCTION MODE")
@@ -76,19 +143,65 @@ class SnowpipeStreamingClient:
         
         self.config = self._load_config(config_file)
         self.jwt_auth = SnowflakeJWTAuth(self.config)
+
+        # PERFORMANCE: One persistent HTTP client for every REST call, so the
+        # TCP+TLS handshake is paid once and reused across all batches.
+        # httpx adds HTTP/2 multiplexing; a requests.Session keep-alive pool
+        # is the fallback when httpx is not installed.
+        if HTTPX_AVAILABLE:
+            try:
+                self._http = httpx.Client(
+                    http2=True,
+                    limits=httpx.Limits(max_keepalive_connections=4,
+                                        keepalive_expiry=300),
+                    timeout=httpx.Timeout(30.0, connect=5.0)
+                )
+                logger.info("Using httpx client (HTTP/2, pooled connections)")
+            except ImportError:
+                # http2 extra (h2) not installed - still get pooling
+                self._http = httpx.Client(
+                    limits=httpx.Limits(max_keepalive_connections=4,
+                                        keepalive_expiry=300),
+                    timeout=httpx.Timeout(30.0, connect=5.0)
+                )
+                logger.info("Using httpx client (HTTP/1.1, pooled connections)")
+        else:
+            self._http = requests.Session()
+            logger.info("Using requests session (keep-alive connections)")
         
         # Streaming state
         self.control_host = None
         self.ingest_host = None
-        # Use unique channel name with timestamp to avoid stale token conflicts
+        # Use unique channel names with timestamp to avoid stale token conflicts.
+        # Rows fan out across num_channels channels partitioned by rowid hash
         base_channel = self.config.get('channel_name', 'TH_CHNL')
         import datetime
         timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
-        self.channel_name = f"{base_channel}_{timestamp}"
-        self.continuation_token = None
-        self.offset_token = 0
+        self.num_channels = max(1, num_channels)
+        self.channels = [
+            StreamingChannel(f"{base_channel}_{timestamp}_{i}")
+            for i in range(self.num_channels)
+        ]
+        self._submit_pool = (
+            ThreadPoolExecutor(max_workers=self.num_channels,
+                               thread_name_prefix='SnowpipeSubmit')
+            if self.num_channels > 1 else None
+        )
+        # Pool backing submit_rows - lets callers keep up to max_async_submits
+        # batches on the wire while they continue collecting rows. Kept
+        # separate from _submit_pool so fan-out subtasks can never deadlock
+        # against top-level submissions
+        self.max_async_submits = 4
+        self._async_pool = ThreadPoolExecutor(max_workers=self.max_async_submits,
+                                              thread_name_prefix='SnowpipeAsync')
         self.scoped_token = None
         self.token_expiry = None
+        self._stats_lock = threading.Lock()
+
+        # Count of append requests currently on the wire - callers use this
+        # to adapt their batch sizes to submission backpressure
+        self._inflight = 0
+        self._inflight_lock = threading.Lock()
         
         # Statistics
         self.stats = {
@@ -103,8 +216,24 @@ class SnowpipeStreamingClient:
         logger.info(f"Database: {self.config['database']}")
         logger.info(f"Schema: {self.config['schema']}")
         logger.info(f"Table: {self.config.get('table', self.config.get('pipe', 'N/A'))}")
-        logger.info(f"Channel: {self.channel_name}")
+        logger.info(f"Channels: {', '.join(ch.name for ch in self.channels)}")
     
+    @property
+    def channel_name(self) -> str:
+        """Name of the primary (first) channel."""
+        return self.channels[0].name
+
+    @property
+    def offset_token(self):
+        """Offset token of the primary (first) channel."""
+        return self.channels[0].offset_token
+
+    @property
+    def inflight(self) -> int:
+        """Number of append requests currently on the wire."""
+        with self._inflight_lock:
+            return self._inflight
+
     def _load_config(self, config_file: str) -> Dict:
         """Load configuration from JSON file."""
         try:
@@ -152,7 +281,7 @@ class SnowpipeStreamingClient:
         
         try:
             # Use GET method for hostname endpoint
-            response = requests.get(url, headers=headers, timeout=30)
+            response = self._http.get(url, headers=headers, timeout=30)
             response.raise_for_status()
             
             logger.debug(f"Response status: {response.status_code}")
@@ -183,159 +312,265 @@ class SnowpipeStreamingClient:
             else:
                 logger.error(f"Empty response from hostname endpoint")
                 raise ValueError("Empty response from hostname endpoint")
-        except requests.exceptions.RequestException as e:
+        except _HTTP_ERRORS as e:
             logger.error(f"Failed to discover ingest host: {e}")
             if hasattr(e, 'response') and e.response is not None:
                 logger.error(f"Response status: {e.response.status_code}")
                 logger.error(f"Response body: {e.response.text}")
             raise
     
-    def open_channel(self) -> Dict:
+    def open_channel(self, channel: Optional[StreamingChannel] = None) -> Dict:
         """
-        Open a streaming channel.
+        Open streaming channel(s).
         Step 3 in the REST API tutorial.
+
+        Args:
+            channel: Specific channel to (re)open. When None, ALL configured
+                     channels are opened.
         """
-        logger.info(f"Opening channel: {self.channel_name}")
-        
+        if channel is not None:
+            return self._open_single_channel(channel)
+
+        data = {}
+        for ch in self.channels:
+            data[ch.name] = self._open_single_channel(ch)
+        return data
+
+    def _open_single_channel(self, channel: StreamingChannel) -> Dict:
+        """Open one streaming channel and store its tokens."""
+        logger.info(f"Opening channel: {channel.name}")
+
         if not self.ingest_host:
             self.discover_ingest_host()
-        
+
         self._ensure_valid_token()
-        
+
         db = self.config['database']
         schema = self.config['schema']
         # Get pipe name - for Snowpipe Streaming v2, we need the PIPE not the table
         pipe = self.config.get('pipe', self.config.get('table'))
-        
+
         # Open channel endpoint - uses PIPES not TABLES
         # https://docs.snowflake.com/en/user-guide/snowpipe-streaming/snowpipe-streaming-high-performance-error-handling
         url = (
             f"https://{self.ingest_host}/v2/streaming"
-            f"/databases/{db}/schemas/{schema}/pipes/{pipe}/channels/{self.channel_name}"
+            f"/databases/{db}/schemas/{schema}/pipes/{pipe}/channels/{channel.name}"
         )
-        
+
         headers = {
             'Authorization': f'Bearer {self.scoped_token}',
             'Content-Type': 'application/json'
         }
-        
+
         # Empty payload as per official docs
         payload = {}
-        
+
         try:
             # Use PUT method with empty body
-            response = requests.put(url, headers=headers, json=payload, timeout=30)
+            response = self._http.put(url, headers=headers, json=payload, timeout=30)
             response.raise_for_status()
-            
+
             data = response.json()
-            
+
             # Debug: Log full response
             logger.debug(f"Open channel response: {json.dumps(data, indent=2)}")
-            
+
             # Extract tokens
-            self.continuation_token = data.get('next_continuation_token')
+            channel.continuation_token = data.get('next_continuation_token')
             channel_status = data.get('channel_status', {})
-            self.offset_token = channel_status.get('last_committed_offset_token')
-            
+            channel.offset_token = channel_status.get('last_committed_offset_token')
+
             # Initialize offset token to 0 if None
-            if self.offset_token is None:
-                self.offset_token = 0
-            
-            logger.info(f"Channel opened successfully")
-            logger.info(f"Continuation token: {self.continuation_token}")
-            logger.info(f"Initial offset token: {self.offset_token}")
-            
-            if not self.continuation_token:
+            if channel.offset_token is None:
+                channel.offset_token = 0
+
+            logger.info(f"Channel {channel.name} opened successfully")
+            logger.info(f"Continuation token: {channel.continuation_token}")
+            logger.info(f"Initial offset token: {channel.offset_token}")
+
+            if not channel.continuation_token:
                 logger.warning("No continuation token received! This may cause issues.")
-            
+
             return data
-            
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to open channel: {e}")
+
+        except _HTTP_ERRORS as e:
+            logger.error(f"Failed to open channel {channel.name}: {e}")
             if hasattr(e, 'response') and e.response is not None:
                 logger.error(f"Response status: {e.response.status_code}")
                 logger.error(f"Response text: {e.response.text}")
             raise
     
-    def insert_rows(self, rows: List[Dict]) -> int:
+    def insert_rows(self, rows: List[Dict]) -> tuple:
         """
-        Insert rows to the streaming channel (alias for append_rows).
-        
+        Insert rows to the streaming channel with CONTINUE-style semantics.
+
+        Instead of making the caller unwind an exception when Snowflake
+        rejects the payload (the ABORT pattern), row-level rejections are
+        reported back through the return value so the caller can retry or
+        quarantine just those rows - the REST-API equivalent of the SDK's
+        ON_ERROR=CONTINUE option. Transport and server (5xx) errors still
+        raise, because the outcome of the whole batch is unknown.
+
         Args:
             rows: List of dictionaries representing the data rows
-            
+
         Returns:
-            Number of rows inserted
+            Tuple of (inserted_count, failed_rows)
         """
         if not rows:
             logger.warning("No rows to insert")
-            return 0
-        
-        # Call append_rows
-        self.append_rows(rows)
-        return len(rows)
+            return 0, []
+
+        if self.num_channels == 1:
+            return self._insert_to_channel(rows, self.channels[0])
+
+        # Partition by rowid hash so a given row always lands on the same
+        # channel, then submit all partitions concurrently
+        parts = [[] for _ in range(self.num_channels)]
+        for row in rows:
+            key = row.get('rowid', '') if isinstance(row, dict) else row
+            parts[hash(key) % self.num_channels].append(row)
+
+        futures = []
+        for ch, part in zip(self.channels, parts):
+            if part:
+                futures.append(
+                    (self._submit_pool.submit(self._insert_to_channel, part, ch),
+                     part, ch)
+                )
+
+        inserted = 0
+        failed_rows = []
+        transport_failed = []
+        for future, part, ch in futures:
+            try:
+                count, failed = future.result()
+                inserted += count
+                failed_rows.extend(failed)
+            except Exception as e:
+                # Transport/5xx failure on one channel: the partition's
+                # outcome is unknown, so it must go through the caller's
+                # transient backoff/reopen path, not the rejection path
+                logger.error(f"Channel {ch.name} submit failed: {e} - "
+                             f"{len(part)} rows need resubmission")
+                transport_failed.extend(part)
+
+        if transport_failed:
+            # Keep the documented contract: transport and server errors raise.
+            # The other channels' successes travel with the exception so the
+            # caller only resubmits the rows whose outcome is unknown.
+            raise PartialInsertError(
+                f"{len(transport_failed)} rows failed at transport level "
+                f"({inserted} inserted on healthy channels)",
+                inserted=inserted,
+                retry_rows=transport_failed + failed_rows,
+            )
+
+        return inserted, failed_rows
+
+    def _insert_to_channel(self, rows: List[Dict], channel: StreamingChannel) -> tuple:
+        """Insert rows to one channel; see insert_rows for the semantics."""
+        try:
+            self.append_rows(rows, channel=channel)
+            return len(rows), []
+        except _HTTP_ERRORS as e:
+            status = None
+            if getattr(e, 'response', None) is not None:
+                status = e.response.status_code
+            if status is not None and 400 <= status < 500:
+                # Batch was rejected, not lost - hand the rows back to the
+                # caller instead of raising
+                logger.error(f"Snowflake rejected batch (status {status}) - "
+                             f"returning {len(rows)} rows to caller")
+                return 0, list(rows)
+            raise
     
-    def append_rows(self, rows: List[Dict]) -> Dict:
+    def append_rows(self, rows: List[Dict], channel: Optional[StreamingChannel] = None) -> Dict:
         """
-        Append rows to the streaming channel.
+        Append rows to a streaming channel.
         Step 4 in the REST API tutorial.
-        
+
         Args:
             rows: List of dictionaries representing the data rows
-            
+            channel: Channel to append to (defaults to the primary channel)
+
         Returns:
             Response dictionary from the API
         """
         if not rows:
             logger.warning("No rows to append")
             return {}
-        
-        logger.info(f"Appending {len(rows)} rows...")
-        
-        if not self.ingest_host or not self.continuation_token:
+
+        if channel is None:
+            channel = self.channels[0]
+
+        logger.info("Appending %d rows to %s...", len(rows), channel.name)
+
+        if not self.ingest_host or not channel.continuation_token:
             raise RuntimeError("Channel not opened. Call open_channel() first.")
-        
+
         self._ensure_valid_token()
-        
-        # Increment offset for this batch
-        new_offset = self.offset_token + 1
-        
+
         db = self.config['database']
         schema = self.config['schema']
         # Get pipe name - for Snowpipe Streaming v2, we need the PIPE not the table
         pipe = self.config.get('pipe', self.config.get('table'))
-        
+
         # Build URL with query parameters - uses PIPES not TABLES
         url = (
             f"https://{self.ingest_host}/v2/streaming/data"
-            f"/databases/{db}/schemas/{schema}/pipes/{pipe}/channels/{self.channel_name}/rows"
+            f"/databases/{db}/schemas/{schema}/pipes/{pipe}/channels/{channel.name}/rows"
         )
-        
-        # Add query parameters
-        params = {
-            'continuationToken': self.continuation_token,
-            'offsetToken': str(new_offset)
-        }
-        
-        logger.debug(f"Append URL: {url}")
-        logger.debug(f"Params: {params}")
-        
+
+        logger.debug("Append URL: %s", url)
+
         headers = {
             'Authorization': f'Bearer {self.scoped_token}',
             'Content-Type': 'application/x-ndjson'
         }
         
-        # Convert rows to NDJSON format
-        ndjson_data = '\n'.join(json.dumps(row) for row in rows)
-        
+        # Convert rows to NDJSON format. Rows that arrive pre-serialized as
+        # bytes (see WeatherSensor.read_sensor_data_bytes) are joined as-is;
+        # dict rows go through dumps_bytes (orjson when available)
+        if isinstance(rows[0], (bytes, bytearray)):
+            ndjson_data = b'\n'.join(rows)
+        else:
+            ndjson_data = b'\n'.join(dumps_bytes(row) for row in rows)
+
+        # One append per channel at a time - the next request's continuation
+        # token comes from this response, so a channel can never have two
+        # appends racing. Overlap happens across channels and between
+        # submission and row collection, not within one channel's token chain.
+        channel.lock.acquire()
+        with self._inflight_lock:
+            self._inflight += 1
         try:
-            response = requests.post(
-                url,
-                params=params,
-                headers=headers,
-                data=ndjson_data.encode('utf-8'),
-                timeout=30
-            )
+            # Increment offset for this batch
+            new_offset = channel.offset_token + 1
+
+            # Add query parameters
+            params = {
+                'continuationToken': channel.continuation_token,
+                'offsetToken': str(new_offset)
+            }
+            logger.debug("Params: %s", params)
+
+            if HTTPX_AVAILABLE:
+                response = self._http.post(
+                    url,
+                    params=params,
+                    headers=headers,
+                    content=ndjson_data,
+                    timeout=30
+                )
+            else:
+                response = self._http.post(
+                    url,
+                    params=params,
+                    headers=headers,
+                    data=ndjson_data,
+                    timeout=30
+                )
             
             # Log response details if error
             if response.status_code >= 400:
@@ -345,77 +580,153 @@ class SnowpipeStreamingClient:
             response.raise_for_status()
             
             data = response.json()
-            
+
             # Update tokens for next append
-            self.continuation_token = data.get('next_continuation_token')
-            
+            channel.continuation_token = data.get('next_continuation_token')
+
             # Update offset token only after successful append
-            self.offset_token = new_offset
-            
-            # Update statistics
-            self.stats['total_rows_sent'] += len(rows)
-            self.stats['total_batches'] += 1
-            self.stats['total_bytes_sent'] += len(ndjson_data)
-            
-            logger.info(f"Successfully appended {len(rows)} rows")
-            logger.debug(f"New offset token: {self.offset_token}")
-            
+            channel.offset_token = new_offset
+
+            # Update statistics (lock: appends may run concurrently per channel)
+            with self._stats_lock:
+                self.stats['total_rows_sent'] += len(rows)
+                self.stats['total_batches'] += 1
+                self.stats['total_bytes_sent'] += len(ndjson_data)
+
+            logger.info("Successfully appended %d rows to %s", len(rows), channel.name)
+            logger.debug("New offset token: %s", channel.offset_token)
+
             return data
-            
-        except requests.exceptions.RequestException as e:
-            self.stats['errors'] += 1
+
+        except _HTTP_ERRORS as e:
+            with self._stats_lock:
+                self.stats['errors'] += 1
             logger.error(f"Failed to append rows: {e}")
-            if hasattr(e.response, 'text'):
+            if getattr(e, 'response', None) is not None:
                 logger.error(f"Response: {e.response.text}")
             raise
-    
-    def get_channel_status(self) -> Dict:
+        finally:
+            with self._inflight_lock:
+                self._inflight -= 1
+            channel.lock.release()
+
+    def submit_rows(self, rows: List[Dict]):
         """
-        Get the current status of the channel.
+        Submit a batch for insertion without waiting for the response.
+
+        This is the submission half of a submission/completion split: the
+        batch is queued on a small pool (up to max_async_submits appends on
+        the wire at once, sharing the pooled connection) and a Future is
+        returned immediately, so the caller can keep collecting rows while
+        earlier batches are in flight and reap all completions in one pass.
+
+        Args:
+            rows: List of dictionaries representing the data rows
+
+        Returns:
+            concurrent.futures.Future resolving to (inserted_count,
+            failed_rows) - the same contract as insert_rows
+        """
+        return self._async_pool.submit(self.insert_rows, rows)
+
+    def reopen_channel_if_needed(self) -> bool:
+        """
+        Re-establish streaming channels after a transient failure.
+
+        Snowflake recommends keeping channels long-lived and reusing them, so
+        this first probes each channel's status and reopens ONLY those that
+        are no longer usable. The last successfully appended offset token is
+        carried over so offset-based dedupe keeps working across the reopen.
+
+        Returns:
+            True if any channel was reopened, False if all were still healthy
+        """
+        logger.info("Checking channel health after failure...")
+
+        reopened = False
+        for channel in self.channels:
+            # Hold the channel lock across probe and reopen - queued
+            # submit_rows batches may still be appending to this channel, and
+            # their token updates must not interleave with the reopen's
+            with channel.lock:
+                try:
+                    status = self.get_channel_status(channel)
+                    if status.get('channel_status_code', 'ACTIVE') != 'INVALID':
+                        continue
+                    logger.warning(f"Channel {channel.name} is INVALID - reopening")
+                except Exception as e:
+                    logger.warning(f"Status check failed for {channel.name} ({e}) - reopening")
+
+                # Re-discover the ingest host once per reopen pass
+                if not reopened:
+                    self.discover_ingest_host()
+
+                # Preserve the last successful offset token across the reopen
+                last_offset = channel.offset_token
+                self._open_single_channel(channel)
+                try:
+                    channel.offset_token = max(int(channel.offset_token or 0),
+                                               int(last_offset or 0))
+                except (TypeError, ValueError):
+                    channel.offset_token = last_offset
+
+                logger.info(f"Channel {channel.name} reopened (offset token: {channel.offset_token})")
+                reopened = True
+
+        if not reopened:
+            logger.info("All channels still valid - no reopen needed")
+        return reopened
+
+    def get_channel_status(self, channel: Optional[StreamingChannel] = None) -> Dict:
+        """
+        Get the current status of a channel (defaults to the primary channel).
         Step 4.4 in the REST API tutorial - Critical for verifying data persistence.
         """
-        logger.debug(f"Getting channel status: {self.channel_name}")
-        
+        if channel is None:
+            channel = self.channels[0]
+
+        logger.debug(f"Getting channel status: {channel.name}")
+
         if not self.ingest_host:
             raise RuntimeError("Ingest host not discovered. Call discover_ingest_host() first.")
-        
+
         self._ensure_valid_token()
-        
+
         db = self.config['database']
         schema = self.config['schema']
         # Get pipe name - for Snowpipe Streaming v2, we need the PIPE not the table
         pipe = self.config.get('pipe', self.config.get('table'))
-        
+
         url = (
             f"https://{self.ingest_host}/v2/streaming"
             f"/databases/{db}/schemas/{schema}/pipes/{pipe}:bulk-channel-status"
         )
-        
+
         headers = {
             'Authorization': f'Bearer {self.scoped_token}',
             'Content-Type': 'application/json'
         }
-        
+
         payload = {
-            'channel_names': [self.channel_name]
+            'channel_names': [channel.name]
         }
-        
+
         try:
-            response = requests.post(url, headers=headers, json=payload, timeout=30)
+            response = self._http.post(url, headers=headers, json=payload, timeout=30)
             response.raise_for_status()
-            
+
             data = response.json()
             channel_statuses = data.get('channel_statuses', {})
-            channel_status = channel_statuses.get(self.channel_name, {})
-            
+            channel_status = channel_statuses.get(channel.name, {})
+
             committed_offset = channel_status.get('committed_offset_token', 0)
             logger.debug(f"Channel committed offset: {committed_offset}")
-            
+
             return channel_status
             
-        except requests.exceptions.RequestException as e:
+        except _HTTP_ERRORS as e:
             logger.error(f"Failed to get channel status: {e}")
-            if hasattr(e.response, 'text'):
+            if getattr(e, 'response', None) is not None:
                 logger.error(f"Response: {e.response.text}")
             raise
     
@@ -454,11 +765,21 @@ class SnowpipeStreamingClient:
         return False
     
     def close_channel(self):
-        """Close the streaming channel (optional - channels auto-close after inactivity)."""
-        logger.info(f"Closing channel: {self.channel_name}")
+        """Close the streaming channel(s) (optional - channels auto-close after inactivity)."""
+        logger.info(f"Closing channels: {', '.join(ch.name for ch in self.channels)}")
         # Note: The REST API doesn't have an explicit close endpoint
         # Channels automatically close after period of inactivity
-        logger.info("Channel will auto-close after inactivity period")
+        logger.info("Channels will auto-close after inactivity period")
+
+        self._async_pool.shutdown(wait=True)
+        if self._submit_pool is not None:
+            self._submit_pool.shutdown(wait=True)
+
+        # Release the pooled HTTP connections
+        try:
+            self._http.close()
+        except Exception as e:
+            logger.debug(f"Error closing HTTP client: {e}")
     
     def print_statistics(self):
         """Print ingestion statistics."""
@@ -13,10 +13,13 @@ Usage:
 
 import argparse
 import logging
+import queue
+import threading
 import time
 import sys
 import os
 import signal
+from collections import deque
 from datetime import datetime
 from typing import Optional
 
@@ -24,7 +27,7 @@ from typing import Optional
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from weather_sensor import WeatherSensor
-from thermal_streaming_client import SnowpipeStreamingClient
+from thermal_streaming_client import SnowpipeStreamingClient, dumps_bytes
 
 # Configure logging
 logging.basicConfig(
@@ -42,21 +45,43 @@ class WeatherStreamingApp:
     """Main application for streaming weather sensor data to Snowflake."""
     
     def __init__(self, config_file: str = 'snowflake_config.json',
-                 batch_size: int = 10, interval: float = 5.0, fast_mode: bool = False):
+                 batch_size: int = 10, interval: float = 5.0, fast_mode: bool = False,
+                 max_batch_bytes: int = 10 * 1024 * 1024, channels: int = 1):
         """
         Initialize the application.
-        
+
         Args:
             config_file: Path to Snowflake configuration file
-            batch_size: Number of readings per batch
-            interval: Seconds between batches
+            batch_size: Number of readings per sensor read pass
+            interval: Maximum seconds between Snowpipe flushes
             fast_mode: If True, maximize throughput by minimizing delays
+            max_batch_bytes: Flush to Snowpipe once this many payload bytes
+                             are pending (Snowflake recommends large batches,
+                             10-16 MB, over many small insert_rows calls)
+            channels: Number of Snowpipe channels to fan rows across
+                      (multiple channels per client scale throughput)
         """
         self.config_file = config_file
         self.batch_size = batch_size
         self.interval = interval
         self.fast_mode = fast_mode
+        self.max_batch_bytes = max_batch_bytes
         self.running = False
+
+        # PERFORMANCE: Sensor sampling and Snowpipe submission run in separate
+        # threads coupled by a bounded queue, so a slow HTTPS round-trip never
+        # stalls sampling (and vice versa)
+        self._row_queue = queue.Queue(maxsize=10_000)
+        self._shutdown_evt = threading.Event()
+
+        # Adaptive batching: grow the per-flush row target when append
+        # requests are already in flight (defer), flush as soon as the target
+        # accumulates when the pipe is idle. Mirrors adaptive I/O submission
+        # batching - many in-flight requests defer further submissions
+        self.max_inflight = 4
+        self._base_batch_rows = max(10, batch_size)
+        self._max_batch_rows = 1000
+        self._min_flush_delay = 0.5  # seconds between adaptive flushes
         
         logger.info("=" * 70)
         logger.info("Weather HAT Streaming Application - PRODUCTION MODE")
@@ -73,8 +98,14 @@ class WeatherStreamingApp:
         self.sensor = WeatherSensor(simulate=False, require_real_sensors=True)
         
         logger.info("Initializing Snowpipe Streaming REST API client...")
-        self.client = SnowpipeStreamingClient(config_file)
+        self.client = SnowpipeStreamingClient(config_file, num_channels=channels)
         
+        # Verbose logging in the ingest path measurably degrades throughput
+        # (per Snowflake's Snowpipe Streaming guidance) - cap the HTTP client
+        # libraries' per-request loggers regardless of our own level
+        for noisy in ('httpx', 'httpcore', 'urllib3', 'requests'):
+            logging.getLogger(noisy).setLevel(logging.WARNING)
+
         # Setup signal handlers for graceful shutdown
         signal.signal(signal.SIGINT, self._signal_handler)
         signal.signal(signal.SIGTERM, self._signal_handler)
@@ -82,6 +113,7 @@ class WeatherStreamingApp:
         logger.info("Initialization complete")
         logger.info(f"Batch size: {batch_size} readings")
         logger.info(f"Batch interval: {interval} seconds")
+        logger.info(f"Max batch size: {max_batch_bytes / (1024 * 1024):.1f} MB")
         if fast_mode:
             logger.info("FAST MODE: Enabled for maximum throughput")
         
@@ -93,6 +125,7 @@ class WeatherStreamingApp:
         """Handle shutdown signals."""
         logger.info(f"\nReceived signal {signum}, shutting down gracefully...")
         self.running = False
+        self._shutdown_evt.set()
     
     def initialize(self):
         """Initialize the Snowpipe Streaming connection."""
@@ -104,10 +137,10 @@ class WeatherStreamingApp:
             ingest_host = self.client.discover_ingest_host()
             logger.info(f"[OK] Ingest host: {ingest_host}")
             
-            # Open channel
-            logger.info("Opening streaming channel...")
+            # Open channel(s)
+            logger.info("Opening streaming channel(s)...")
             self.client.open_channel()
-            logger.info("[OK] Channel opened successfully")
+            logger.info("[OK] Channel(s) opened successfully")
             
             logger.info("Snowpipe Streaming connection ready!")
             return True
@@ -116,80 +149,265 @@ class WeatherStreamingApp:
             logger.error(f"Failed to initialize streaming: {e}", exc_info=True)
             return False
     
+    def _producer_loop(self, sample_interval: float):
+        """
+        Producer thread: pull readings from the (already async) sensor cache
+        into the row queue at the configured sample rate.
+        """
+        logger.info(f"Producer thread started (sampling every {sample_interval:.2f}s)")
+
+        while not self._shutdown_evt.is_set():
+            try:
+                data = self.sensor.read_sensor_data()
+                try:
+                    self._row_queue.put_nowait(data)
+                except queue.Full:
+                    logger.warning("Row queue full - dropping reading")
+            except Exception as e:
+                logger.error(f"Error reading sensor data: {e}")
+
+            # Event.wait returns early only on shutdown
+            self._shutdown_evt.wait(sample_interval)
+
+        logger.info("Producer thread exited")
+
+    def _consumer_loop(self):
+        """
+        Consumer thread: drain the row queue and flush to Snowpipe Streaming
+        once a byte or time threshold is hit.
+
+        Pending rows accumulate until a flush threshold is hit - Snowflake
+        recommends fewer, larger insert_rows calls (10-16 MB) over many small
+        per-interval batches.
+
+        Flushes are submitted asynchronously (client.submit_rows) with up to
+        max_inflight batches on the wire at once; completions are reaped in a
+        single pass at the top of each loop, and new submissions are deferred
+        while the pipe is full.
+        """
+        logger.info("Consumer thread started")
+
+        pending = deque()
+        pending_bytes = 0
+        last_flush = time.monotonic()
+        flush_count = 0
+        reconnect_attempts = 0
+
+        # Batches on the wire: (future, rows) pairs awaiting completion.
+        # Submission and completion are decoupled so the consumer keeps
+        # collecting rows while up to max_inflight appends are outstanding,
+        # reaping whatever finished in one pass per loop
+        in_flight = deque()
+
+        # Rows Snowflake rejected get a bounded number of retries instead of
+        # failing the whole batch (CONTINUE semantics)
+        retry_rows = deque(maxlen=1000)
+        retry_attempts = {}
+
+        while True:
+            shutting_down = self._shutdown_evt.is_set()
+
+            # Drain the queue: block briefly for the first row, then grab
+            # whatever else is immediately available
+            try:
+                row = self._row_queue.get(timeout=0.5)
+                pending.append(row)
+                pending_bytes += len(dumps_bytes(row)) + 1  # +1 for newline
+                while pending_bytes < self.max_batch_bytes:
+                    try:
+                        row = self._row_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    pending.append(row)
+                    pending_bytes += len(dumps_bytes(row)) + 1
+            except queue.Empty:
+                pass
+
+            # Reap completed submissions in one pass; unfinished ones go
+            # straight back on the deque
+            still_waiting = deque()
+            while in_flight:
+                future, rows = in_flight.popleft()
+                if not future.done():
+                    still_waiting.append((future, rows))
+                    continue
+                try:
+                    row_count, failed_rows = future.result()
+                except Exception as e:
+                    # Transient network/server error (row-level rejections come
+                    # back through the return value, not exceptions): back off,
+                    # reopen the channel only if it went invalid, and hand the
+                    # batch back through the retry buffer. Never tear the
+                    # channel down - Snowflake recommends long-lived channels
+                    # to preserve offset-token dedupe.
+                    logger.error(f"Failed to insert batch: {e}")
+                    # Fan-out mode reports partial progress through the
+                    # exception - resubmit only the rows whose outcome is
+                    # unknown, not the partitions that already landed
+                    rows = getattr(e, 'retry_rows', rows)
+                    inserted = getattr(e, 'inserted', 0)
+                    if inserted:
+                        logger.info("[OK] Successfully sent %d readings to "
+                                    "Snowpipe Streaming", inserted)
+                    if shutting_down:
+                        logger.error(f"Dropping {len(rows)} rows - shutting down")
+                        continue
+                    reconnect_attempts += 1
+                    backoff = min(30, 2 ** reconnect_attempts)
+                    logger.warning(f"Transient failure - retrying batch in {backoff}s "
+                                   f"(attempt {reconnect_attempts})")
+                    self._shutdown_evt.wait(backoff)
+                    try:
+                        self.client.reopen_channel_if_needed()
+                    except Exception as reopen_err:
+                        logger.error(f"Channel reopen failed: {reopen_err}")
+                    before = len(retry_rows)
+                    retry_rows.extend(rows)
+                    kept = len(retry_rows) - before
+                    if kept < len(rows):
+                        logger.error("Retry buffer full - dropped %d rows",
+                                     len(rows) - kept)
+                    continue
+
+                if failed_rows:
+                    # Requeue rejected rows for a bounded number of retries
+                    requeued = 0
+                    for row in failed_rows:
+                        attempts = retry_attempts.get(row['rowid'], 0) + 1
+                        if attempts <= 2:
+                            retry_attempts[row['rowid']] = attempts
+                            retry_rows.append(row)
+                            requeued += 1
+                        else:
+                            retry_attempts.pop(row['rowid'], None)
+                    logger.warning(f"{len(failed_rows)} rows rejected by Snowflake - "
+                                   f"requeued {requeued}, dropped {len(failed_rows) - requeued}")
+                else:
+                    for row in rows:
+                        retry_attempts.pop(row['rowid'], None)
+
+                if row_count:
+                    logger.info("[OK] Successfully sent %d readings to Snowpipe Streaming",
+                                row_count)
+                reconnect_attempts = 0
+            in_flight = still_waiting
+
+            # Adaptive row target: scales with the in-flight submission count
+            # so a busy pipe defers (bigger batches) and an idle pipe flushes
+            # as soon as the base target accumulates
+            inflight = len(in_flight)
+            target_rows = int(self._base_batch_rows * (1 + inflight / self.max_inflight))
+            target_rows = max(10, min(target_rows, self._max_batch_rows))
+
+            # On shutdown, rows parked for retry get one last send attempt
+            # even when nothing new is pending - otherwise rows handed back
+            # by the final in-flight batch would be discarded silently
+            if shutting_down and retry_rows and not pending:
+                while retry_rows:
+                    row = retry_rows.popleft()
+                    pending.append(row)
+                    pending_bytes += len(dumps_bytes(row)) + 1
+
+            # Flush when enough bytes are pending, the adaptive row target is
+            # reached (at most every _min_flush_delay), the interval elapsed,
+            # or we are shutting down
+            now = time.monotonic()
+            adaptive_due = (len(pending) >= target_rows and
+                            now - last_flush >= self._min_flush_delay)
+            flush_due = bool(pending) and (pending_bytes >= self.max_batch_bytes or
+                                           adaptive_due or
+                                           now - last_flush >= self.interval or
+                                           shutting_down)
+
+            # When the submission side is saturated, defer - rows keep
+            # accumulating into a bigger batch until a completion frees a slot
+            if flush_due and inflight >= self.max_inflight:
+                logger.debug("Submission pipe full (%d in flight) - deferring flush",
+                             inflight)
+                flush_due = False
+
+            if flush_due:
+                flush_count += 1
+                sample = pending[0]
+                # %-style args defer the string formatting until the record
+                # is actually emitted (skipped entirely under quiet levels)
+                logger.info("\n--- Flush %d (%d rows, %d bytes, %d in flight) ---",
+                            flush_count, len(pending), pending_bytes, inflight)
+                logger.info("Sample reading: Temp=%.1f°F, Humidity=%.1f%%, "
+                            "Pressure=%.2fhPa, Lux=%.2f",
+                            sample['temperature'], sample['humidity'],
+                            sample['pressure'], sample['lux'])
+
+                # Fold in rows waiting for retry from earlier rejected batches
+                while retry_rows:
+                    pending.appendleft(retry_rows.popleft())
+
+                # Submit without blocking; the result is reaped on a later pass
+                batch = list(pending)
+                in_flight.append((self.client.submit_rows(batch), batch))
+                pending.clear()
+                pending_bytes = 0
+                last_flush = now
+
+                # Print statistics every 10 flushes
+                if flush_count % 10 == 0:
+                    self.client.print_statistics()
+
+            if (shutting_down and not pending and not retry_rows
+                    and not in_flight and self._row_queue.empty()):
+                break
+
+        logger.info("Consumer thread exited")
+
     def run(self):
         """Main application loop."""
         if not self.initialize():
             logger.error("Initialization failed, exiting")
             return 1
-        
+
         self.running = True
-        batch_count = 0
-        
+        self._shutdown_evt.clear()
+
+        # Sample pacing matches the old read_batch behavior
+        sample_interval = 0.05 if self.fast_mode else max(0.5, self.interval / self.batch_size)
+
+        producer = threading.Thread(
+            target=self._producer_loop,
+            args=(sample_interval,),
+            daemon=True,
+            name="WeatherProducerThread"
+        )
+        consumer = threading.Thread(
+            target=self._consumer_loop,
+            daemon=True,
+            name="SnowpipeConsumerThread"
+        )
+
         logger.info("=" * 70)
         logger.info("Starting weather data collection and streaming...")
         logger.info("Press Ctrl+C to stop")
         logger.info("=" * 70)
-        
+
         try:
-            while self.running:
-                batch_count += 1
-                batch_start = time.time()
-                
-                logger.info(f"\n--- Batch {batch_count} ---")
-                
-                # Read sensor data
-                logger.info(f"Reading {self.batch_size} weather sensor samples...")
-                if self.fast_mode:
-                    # Fast mode: minimal delay between readings
-                    readings = self.sensor.read_batch(
-                        count=self.batch_size,
-                        interval=0.05,  # 50ms minimum
-                        fast_mode=True
-                    )
-                else:
-                    # Normal mode: spread readings over time
-                    readings = self.sensor.read_batch(
-                        count=self.batch_size,
-                        interval=max(0.5, self.interval / self.batch_size)
-                    )
-                
-                # Log sample data
-                if readings:
-                    sample = readings[0]
-                    logger.info(f"Sample reading: Temp={sample['temperature']:.1f}°F, "
-                               f"Humidity={sample['humidity']:.1f}%, "
-                               f"Pressure={sample['pressure']:.2f}hPa, "
-                               f"Lux={sample['lux']:.2f}")
-                    logger.info(f"Local hostname: {sample.get('hostname', 'N/A')}")
-                
-                # Insert to Snowflake via Snowpipe Streaming
-                try:
-                    row_count = self.client.insert_rows(readings)
-                    logger.info(f"[OK] Successfully sent {row_count} readings to Snowpipe Streaming")
-                    
-                except Exception as e:
-                    logger.error(f"Failed to insert batch: {e}")
-                    # Continue to next batch even if this one fails
-                
-                # Print statistics every 10 batches
-                if batch_count % 10 == 0:
-                    self.client.print_statistics()
-                
-                # Calculate sleep time to maintain interval
-                batch_elapsed = time.time() - batch_start
-                sleep_time = max(0, self.interval - batch_elapsed)
-                
-                if sleep_time > 0 and self.running:
-                    logger.info(f"Waiting {sleep_time:.1f}s until next batch...")
-                    time.sleep(sleep_time)
-        
+            producer.start()
+            consumer.start()
+
+            # Main thread just waits for shutdown
+            while self.running and not self._shutdown_evt.is_set():
+                self._shutdown_evt.wait(timeout=1.0)
+
         except Exception as e:
             logger.error(f"Error in main loop: {e}", exc_info=True)
             return 1
-        
+
         finally:
+            self._shutdown_evt.set()
+            self.running = False
+            producer.join(timeout=5.0)
+            # Consumer drains and flushes remaining rows before exiting
+            consumer.join(timeout=30.0)
             self.shutdown()
-        
+
         return 0
     
     def shutdown(self):
@@ -240,6 +458,18 @@ def main():
         default=5.0,
         help='Seconds between batches (default: 5.0)'
     )
+    parser.add_argument(
+        '--channels',
+        type=int,
+        default=1,
+        help='Number of Snowpipe channels to fan rows across (default: 1)'
+    )
+    parser.add_argument(
+        '--max-batch-bytes',
+        type=int,
+        default=10 * 1024 * 1024,
+        help='Flush to Snowpipe once this many payload bytes are pending (default: 10 MB)'
+    )
     parser.add_argument(
         '--verbose',
         action='store_true',
@@ -265,7 +495,9 @@ def main():
         config_file=args.config,
         batch_size=args.batch_size,
         interval=args.interval,
-        fast_mode=args.fast
+        fast_mode=args.fast,
+        max_batch_bytes=args.max_batch_bytes,
+        channels=args.channels
     )
     
     exit_code = app.run()